@@ -103,12 +103,8 @@ def run(args: argparse.Namespace) -> Scraper:
         # tabulate shortened table (first and last 5 rows of table with dots
         # inbetween
         else:
-            shortened_table = value[:5]
-            for _ in range(3):
-                shortened_table.append({})
-                for key in shortened_table[0].keys():
-                    shortened_table[-1][key] = "..."
-            shortened_table.extend(value[-5:])
+            dots_row = dict.fromkeys(value[0].keys(), "...")
+            shortened_table = value[:5] + [dots_row] * 3 + value[-5:]
             print(tabulate(shortened_table, headers="keys"))
     return scraper_obj
 
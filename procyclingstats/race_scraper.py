@@ -1,6 +1,8 @@
 import re
 from typing import Any, Dict, List
 
+from selectolax.parser import Node
+
 from .errors import ExpectedParsingError, UnexpectedParsingError
 from .scraper import Scraper
 from .table_parser import TableParser
@@ -26,6 +28,12 @@ class Race(Scraper):
     }
 
     """
+    _year_regex = re.compile(r"(\d{4})")
+    """Matches four digits long year."""
+    _prev_edition_url_regex = re.compile(
+        r"race/[^/]+/\d{4}/statistics/start")
+    """Matches URL of previous edition's statistics."""
+
     def year(self) -> int:
         """
         Parse year when the race occured from HTML.
@@ -39,7 +47,7 @@ class Race(Scraper):
 
         text = span.text().strip()
 
-        match = re.search(r"(\d{4})", text)
+        match = self._year_regex.search(text)
 
         if not match:
             raise ExpectedParsingError(f"Impossible to parse year in '{text}'")
@@ -69,12 +77,10 @@ class Race(Scraper):
 
         :return: Whether given race is one day race.
         """
-        titles = self.html.css("div > div > h4")
-        titles = [] if not titles else titles
-        for title_html in titles:
-            if "Stages" in title_html.text():
-                return False
-        return True
+        # result is cached, because stages parsing methods check it too
+        return self._cached("is_one_day_race", lambda: not any(
+            "Stages" in title_html.text()
+            for title_html in self.html.css("div > div > h4")))
 
     def nationality(self) -> str:
         """
@@ -114,9 +120,7 @@ class Race(Scraper):
 
         :return: Startdate in ``YYYY-MM-DD`` format.
         """
-        startdate_html = self.html.css_first(
-            ".list > li > div:nth-child(2)")
-        return startdate_html.text()
+        return self._race_info_values()[0].text()
 
     def enddate(self) -> str:
         """
@@ -124,8 +128,7 @@ class Race(Scraper):
 
         :return: Enddate in ``YYYY-MM-DD`` format.
         """
-        enddate_html = self.html.css(".list > li > div:nth-child(2)")[1] 
-        return enddate_html.text()
+        return self._race_info_values()[1].text()
 
     def category(self) -> str:
         """
@@ -133,8 +136,7 @@ class Race(Scraper):
 
         :return: Race category e.g. ``Men Elite``.
         """
-        category_html = self.html.css(".list > li > div:nth-child(2)")[2]
-        return category_html.text()
+        return self._race_info_values()[2].text()
 
     def uci_tour(self) -> str:
         """
@@ -142,8 +144,7 @@ class Race(Scraper):
 
         :return: UCI Tour of the race e.g. ``UCI Worldtour``.
         """
-        uci_tour_html = self.html.css(".list > li > div:nth-child(2)")[3]
-        return uci_tour_html.text()
+        return self._race_info_values()[3].text()
 
     def prev_editions_select(self) -> List[Dict[str, str]]:
         """
@@ -155,11 +156,13 @@ class Race(Scraper):
         select_elements = self.html.css("div.selectNav select")
 
         for select in select_elements:
-            options = select.css("option")
-            values = [opt.attributes.get("value", "") for opt in options]
+            # values are generated lazily so the check stops on first option
+            # that doesn't match
+            values = (opt.attributes.get("value", "")
+                      for opt in select.css("option"))
 
             # Match values that look like race/<race-name>/<year>/statistics/start
-            if all(re.match(r"race/[^/]+/\d{4}/statistics/start", v) for v in values if v):
+            if all(self._prev_edition_url_regex.match(v) for v in values if v):
                 return parse_select(select)
         return []
 
@@ -278,3 +281,13 @@ class Race(Scraper):
             table_parser.extend_table("stage_name", stage_names)
                     
         return table_parser.table
+
+    def _race_info_values(self) -> List[Node]:
+        """
+        Finds value elements of race info list (startdate, enddate, category,
+        UCI Tour...).
+
+        :return: List of race info value elements.
+        """
+        return self._cached("_race_info_values", lambda: self.html.css(
+            ".list > li > div:nth-child(2)"))
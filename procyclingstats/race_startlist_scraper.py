@@ -89,12 +89,12 @@ class RaceStartlist(Scraper):
             "rider_url",
             "nationality"
         ]
+        rider_f_to_parse = [f for f in casual_rider_fields if f in fields]
         table = []
         startlist_html = self.html.css_first(".startlist_v4")
         for team_html in startlist_html.css(".ridersCont"):
             riders_table = team_html.css_first("ul")
             table_parser = TableParser(riders_table)
-            rider_f_to_parse = [f for f in casual_rider_fields if f in fields]
             table_parser.parse(rider_f_to_parse)
             # add rider numbers to the table if needed
             if "rider_number" in fields:
@@ -106,16 +106,14 @@ class RaceStartlist(Scraper):
                     else:
                         numbers.append(None)
                 table_parser.extend_table("rider_number", numbers)
+            team_a = team_html.css_first("a")
             # add team names to the table if needed
             if "team_name" in fields:
-                team_name = team_html.css_first("a").text()
-                team_names = [team_name for _ in range(
-                    len(table_parser.table))]
+                team_names = [team_a.text()] * len(table_parser.table)
                 table_parser.extend_table("team_name", team_names)
             # add team urls to the table if needed
             if "team_url" in fields:
-                team_url = team_html.css_first("a").attributes['href']
-                team_urls = [team_url for _ in range(len(table_parser.table))]
+                team_urls = [team_a.attributes['href']] * len(table_parser.table)
                 table_parser.extend_table("team_url", team_urls)
             # add team table to startlist table
             table.extend(table_parser.table)
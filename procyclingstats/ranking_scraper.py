@@ -1,4 +1,3 @@
-import re
 from typing import Any, Dict, List, Literal, Tuple
 
 from .errors import ExpectedParsingError
@@ -491,10 +490,9 @@ class Ranking(Scraper):
         relative_url = self.relative_url()
         if relative_url == "rankings" or relative_url == "rankings/":
             return "individual"
-        if "races" in relative_url:
-            l = [m.start() for m in re.finditer("races", relative_url)]
-            if relative_url[l[0] - 1] != "-":
-                return "races"
+        races_index = relative_url.find("races")
+        if races_index != -1 and relative_url[races_index - 1] != "-":
+            return "races"
         if "distance" in relative_url:
             return "distance"
         if "racedays" in relative_url:
@@ -1,11 +1,10 @@
-import calendar
 from typing import Any, Dict, List, Optional
 import re
 from selectolax.parser import HTMLParser
 
 from .scraper import Scraper
 from .table_parser import TableParser
-from .utils import get_day_month, parse_table_fields_args
+from .utils import MONTHS_NUMBERS, get_day_month, parse_table_fields_args
 
 
 class Rider(Scraper):
@@ -32,6 +31,11 @@ class Rider(Scraper):
         ...
     }
     """
+    _team_class_regex = re.compile(r"\(([^0-9][A-Z]+)\)")
+    """Matches team class in parentheses, e.g. ``(WT)``."""
+    _whitespaces_regex = re.compile(r"\s+")
+    """Matches sequence of whitespace characters."""
+
     def birthdate(self) -> str:
         """
         Parses rider's birthdate from HTML.
@@ -39,11 +43,12 @@ class Rider(Scraper):
         :return: birthday of the rider in ``YYYY-MM-DD`` format.
         """
         bd_node = self._get_rider_content_node().css("div > ul > li")[1]
-        day_str = bd_node.css(".mr3")[0].text()
-        day = "".join(c for c in day_str if c.isdigit())
-        month_str = bd_node.css(".mr3")[1].text()
-        month = list(calendar.month_name).index(month_str)
-        year = int(bd_node.css(".mr3")[2].text())
+        day_html, month_html, year_html = bd_node.css(".mr3")[:3]
+        day = "".join(c for c in day_html.text() if c.isdigit())
+        month = MONTHS_NUMBERS.get(month_html.text().lower())
+        if month is None:
+            raise ValueError(f"Invalid month name: '{month_html.text()}'")
+        year = int(year_html.text())
         return f"{year}-{month}-{day}"
 
     def place_of_birth(self) -> Optional[str]:
@@ -64,7 +69,7 @@ class Rider(Scraper):
         :return: Rider's name.
         """
         raw_name = self.html.css_first(".titleCont > .page-title > .title > h1").text()
-        return re.sub(r'\s+', ' ', raw_name).strip()
+        return self._whitespaces_regex.sub(' ', raw_name).strip()
 
     def weight(self) -> Optional[float]:
         """
@@ -72,12 +77,7 @@ class Rider(Scraper):
 
         :return: Rider's weight in kilograms.
         """
-        extra = 0
-        if "Passed" in self._get_rider_content_node().text():
-            extra = 1
-        weight_cont = self._get_rider_content_node().css_first(
-            f"div:nth-child({4 + extra}) > ul.list")
-        weight_html = weight_cont.css("li .mr3")[0]
+        weight_html = self._get_weight_height_node().css("li .mr3")[0]
         return float(weight_html.text())
 
     def height(self) -> Optional[float]:
@@ -86,12 +86,7 @@ class Rider(Scraper):
 
         :return: Rider's height in meters.
         """
-        extra = 0
-        if "Passed" in self._get_rider_content_node().text():
-            extra = 1
-        height_cont = self._get_rider_content_node().css_first(
-            f"div:nth-child({4 + extra}) > ul.list")
-        height_html = height_cont.css("li > .mr3")[1]
+        height_html = self._get_weight_height_node().css("li > .mr3")[1]
         return float(height_html.text())
 
     def nationality(self) -> str:
@@ -151,19 +146,23 @@ class Rider(Scraper):
         seasons_html_table = self.html.css_first("ul.rdr-teams2")
         # Filter out invalid items that do not have a season div ('Suspended...')
         valid_items = [li for li in seasons_html_table.css("li.main") if li.css_first("div.season")]
-        filtered_ul_html = "<ul class='rdr-teams2'>{}</ul>".format("".join(li.html for li in valid_items))
-        # Parse a new HTML string with the filtered items
-        filtered_ul_node = HTMLParser(filtered_ul_html).css_first("ul.rdr-teams2")
+        if len(valid_items) == len(seasons_html_table.css("li")):
+            # nothing to filter out, so the table can be parsed directly
+            filtered_ul_node = seasons_html_table
+        else:
+            filtered_ul_html = "<ul class='rdr-teams2'>{}</ul>".format("".join(li.html for li in valid_items))
+            # Parse a new HTML string with the filtered items
+            filtered_ul_node = HTMLParser(filtered_ul_html).css_first("ul.rdr-teams2")
         table_parser = TableParser(filtered_ul_node)
         casual_fields = [f for f in fields
                          if f in ("season", "team_name", "team_url")]
         if casual_fields:
             table_parser.parse(casual_fields)
         # add classes for row validity checking
-        classes = table_parser.parse_extra_column(
-            1,
-            lambda x: re.search(r"\(([^0-9][A-Z]+)\)", x).group(1) if x and re.search(r"\(([^0-9][A-Z]+)\)", x) else None
-        )
+        def parse_team_class(text: str) -> Optional[str]:
+            match = self._team_class_regex.search(text) if text else None
+            return match.group(1) if match else None
+        classes = table_parser.parse_extra_column(1, parse_team_class)
         table_parser.extend_table("class", classes)
         if "since" in fields:
             until_dates = table_parser.parse_extra_column(-2,
@@ -214,7 +213,7 @@ class Rider(Scraper):
         """
         specialty_html = self.html.css(".pps .xvalue")
         pnts = [int(e.text()) for e in specialty_html]
-        keys = ["one_day_races", "gc", "time_trial", "sprint", "climber", "hills"]
+        keys = ("one_day_races", "gc", "time_trial", "sprint", "climber", "hills")
         return dict(zip(keys, pnts))
     
     def season_results(self, *args: str) -> List[Dict[str, Any]]:
@@ -304,5 +303,18 @@ class Rider(Scraper):
         return table_parser.table
 
     def _get_rider_content_node(self):
-        return self.html.css("div.page-content > div > .borderbox > .borderbox")[2]
+        # node is cached, because most of the rider info methods are parsing
+        # from it
+        return self._cached("_get_rider_content_node", lambda: self.html.css(
+            "div.page-content > div > .borderbox > .borderbox")[2])
+
+    def _get_weight_height_node(self):
+        # node is cached, so whole rider content text is searched for "Passed"
+        # only once (pages of riders who passed away have one more info row)
+        def find_node():
+            rider_content_node = self._get_rider_content_node()
+            extra = 1 if "Passed" in rider_content_node.text() else 0
+            return rider_content_node.css_first(
+                f"div:nth-child({4 + extra}) > ul.list")
+        return self._cached("_get_weight_height_node", find_node)
 
@@ -17,6 +17,9 @@ class Scraper:
         "fetch_html",  
     )
     """Public methods that aren't called by `parse` method."""
+    _parsing_methods_names: Dict[Type["Scraper"], Tuple[str, ...]] = {}
+    """Names of parsing methods of every scraping class, found on first
+    parsing."""
 
     def __init__(self, url: str, html: Optional[str] = None,
                  update_html: bool = True) -> None:
@@ -38,7 +41,11 @@ class Scraper:
         """
         # validate given URL
         self._url = self._make_url_absolute(url)
+        # URL doesn't change, so relative URL is made only once
+        self._relative_url = "/".join(self._url.split("/")[3:])
         self._html = None
+        # values parsed from current HTML, see `_cached`
+        self._cache: Dict[str, Any] = {}
         if html:
             self._html = HTMLParser(html)
             if not self._html_valid():
@@ -74,11 +81,12 @@ class Scraper:
 
     def relative_url(self) -> str:
         """
-        Makes relative URL from absolute url (cuts `self.BASE_URL` from URL).
+        Relative URL made from absolute URL when constructing (`self.url`
+        without `self.BASE_URL`).
 
         :return: Relative URL.
         """
-        return "/".join(self._url.split("/")[3:])
+        return self._relative_url
 
     def update_html(self) -> None:
         """
@@ -88,6 +96,8 @@ class Scraper:
         html_str = requests.get(self._url).text \
             # pylint: disable=missing-timeout
         self._html = HTMLParser(html_str)
+        # values parsed from previous HTML are no longer valid
+        self._cache = {}
 
     def fetch_html(self, url: str) -> HTMLParser:
         """
@@ -134,6 +144,21 @@ class Scraper:
         splitted_url = self.relative_url().split("/")
         return [part for part in splitted_url if part]
 
+    def _cached(self, key: str, compute: Callable[[], Any]) -> Any:
+        """
+        Gets value parsed from current HTML. Value is computed only on first
+        call with given key, later calls return the stored value until the
+        HTML is updated.
+
+        :param key: Name of the cached value, by convention name of the
+            method that is caching it.
+        :param compute: Function without params that parses the value.
+        :return: Parsed value.
+        """
+        if key not in self._cache:
+            self._cache[key] = compute()
+        return self._cache[key]
+
     def _parsing_methods(self) -> List[Tuple[str, Callable]]:
         """
         Gets all parsing methods from a class. That are all public methods
@@ -141,13 +166,15 @@ class Scraper:
 
         :return: List of tuples parsing methods names and parsing methods.
         """
-        methods = inspect.getmembers(self, predicate=inspect.ismethod)
-        parsing_methods = []
-        for method_name, method in methods:
-            if (method_name[0] != "_"
-                and method_name not in self._public_nonparsing_methods):
-                parsing_methods.append((method_name, method))
-        return parsing_methods
+        scraper_class = type(self)
+        if scraper_class not in self._parsing_methods_names:
+            methods = inspect.getmembers(self, predicate=inspect.ismethod)
+            self._parsing_methods_names[scraper_class] = tuple(
+                method_name for method_name, _ in methods
+                if (method_name[0] != "_"
+                    and method_name not in self._public_nonparsing_methods))
+        return [(method_name, getattr(self, method_name))
+                for method_name in self._parsing_methods_names[scraper_class]]
 
     def _make_url_absolute(self, url: str) -> str:
         """
@@ -47,6 +47,19 @@ class Stage(Scraper):
     }
     """
     _tables_path = ".resultCont .resTab .general table.results"
+    _result_tabs_keywords: Tuple[Tuple[str, str], ...] = (
+        ("stage", "STAGE"),
+        ("gc", "GC"),
+        ("points", "POINTS"),
+        ("kom", "KOM"),
+        ("youth", "YOUTH"),
+        ("teams", "TEAMS")
+    )
+    """Pairs of table keyword and text of its tab in uppercase."""
+    _kom_category_regex = re.compile(r"KOM Sprint \(([^)]+)\)")
+    """Matches climb category in KOM sprint header, e.g. ``(HC)``."""
+    _kom_climb_name_regex = re.compile(r"\)\s*(.+?)\s*\(")
+    """Matches climb name in KOM sprint header."""
 
     def is_one_day_race(self) -> bool:
         """
@@ -56,7 +69,8 @@ class Stage(Scraper):
         """
         # If there are elements with .restabs class (Stage/GC... menu), the race
         # is a stage race
-        return len(self.html.css(".restabs")) == 0 and len(self.html.css(".resultTabs")) == 0
+        return (self.html.css_first(".restabs") is None and
+                self.html.css_first(".resultTabs") is None)
 
     def distance(self) -> float:
         """
@@ -110,12 +124,11 @@ class Stage(Scraper):
 
         :return: Average temperature in degree celsius as float.
         """
-        temp_str1 = self._stage_info_by_label("Avg. temp")
-        temp_str2 = self._stage_info_by_label("Average temp")
-        if temp_str1:
-            return float(temp_str1.split(" ")[0])
-        elif temp_str2:
-            return float(temp_str2.split(" ")[0])
+        # second label is looked up only when the first one isn't found
+        temp_str = (self._stage_info_by_label("Avg. temp") or
+                    self._stage_info_by_label("Average temp"))
+        if temp_str:
+            return float(temp_str.split(" ")[0])
         return None
 
     def date(self) -> str:
@@ -296,13 +309,26 @@ class Stage(Scraper):
             return []
 
         # 3. Parse each climb's ranking table
+        rider_fields = (
+            "rider_name",
+            "rider_url",
+            "rider_number",
+            "team_name",
+            "team_url",
+            "rank",
+            "points",
+            "age",
+            "nationality",
+            "pcs_points",
+            "uci_points"
+        )
         climb_results = []
         for h4 in today_section.css("h4"):
             header_text = h4.text(strip=True)
-            match = re.search(r"KOM Sprint \(([^)]+)\)", header_text)
+            match = self._kom_category_regex.search(header_text)
             category = match.group(1) if match else None
 
-            climb_name_match = re.search(r"\)\s*(.+?)\s*\(", header_text)
+            climb_name_match = self._kom_climb_name_regex.search(header_text)
             climb_name = climb_name_match.group(1) if climb_name_match else header_text
 
             table = h4.next
@@ -312,19 +338,6 @@ class Stage(Scraper):
                 continue
 
             table_parser = TableParser(table)
-            rider_fields = [
-                "rider_name",
-                "rider_url",
-                "rider_number",
-                "team_name",
-                "team_url",
-                "rank",
-                "points",
-                "age",
-                "nationality",
-                "pcs_points",
-                "uci_points"
-            ]
             table_parser.parse(rider_fields)
             rank = table_parser.table
 
@@ -336,14 +349,23 @@ class Stage(Scraper):
             }
             climb_results.append(climb_info)
 
-        # 4. Merge climb_url from climbs list if possible
+        # 4. Merge climb_url from climbs list if possible, names are lowercased
+        # only once
+        climbs_names_urls = [(c["climb_name"].lower(), c["climb_url"])
+                             for c in climbs if c["climb_name"]]
         for climb in climb_results:
-            for c in climbs:
-                if c["climb_name"] and climb["climb_name"] and c["climb_name"].lower() in climb["climb_name"].lower():
-                    climb["climb_url"] = c["climb_url"]
+            if not climb["climb_name"]:
+                continue
+            climb_name = climb["climb_name"].lower()
+            for c_name, c_url in climbs_names_urls:
+                if c_name in climb_name:
+                    climb["climb_url"] = c_url
                     break
 
-        # 5. Filter fields if needed
+        # 5. Filter fields if needed, climbs already have all the fields in
+        # the right order when all of them are wanted
+        if tuple(fields) == available_fields:
+            return climb_results
         final_results = []
         for climb in climb_results:
             result = {field: climb[field] for field in fields if field in climb}
@@ -492,14 +514,7 @@ class Stage(Scraper):
             "pcs_points",
             "uci_points"
         )
-        fields = parse_table_fields_args(args, available_fields)
-        # remove other result tables from html
-        gc_table_html = self._table_html("gc")
-        if not gc_table_html:
-            return []
-        table_parser = TableParser(gc_table_html)
-        table_parser.parse(fields)
-        return table_parser.table
+        return self._parse_classification_table("gc", args, available_fields)
 
     def points(self, *args: str) -> List[Dict[str, Any]]:
         """
@@ -539,14 +554,8 @@ class Stage(Scraper):
             "pcs_points",
             "uci_points"
         )
-        fields = parse_table_fields_args(args, available_fields)
-        # remove other result tables from html
-        points_table_html = self._table_html("points")
-        if not points_table_html:
-            return []
-        table_parser = TableParser(points_table_html)
-        table_parser.parse(fields)
-        return table_parser.table
+        return self._parse_classification_table("points", args,
+                                                available_fields)
 
     def kom(self, *args: str) -> List[Dict[str, Any]]:
         """
@@ -586,14 +595,8 @@ class Stage(Scraper):
             "pcs_points",
             "uci_points"
         )
-        fields = parse_table_fields_args(args, available_fields)
-        # remove other result tables from html
-        kom_table_html = self._table_html("kom")
-        if not kom_table_html:
-            return []
-        table_parser = TableParser(kom_table_html)
-        table_parser.parse(fields)
-        return table_parser.table
+        return self._parse_classification_table("kom", args,
+                                                available_fields)
 
     def youth(self, *args: str) -> List[Dict[str, Any]]:
         """
@@ -633,13 +636,8 @@ class Stage(Scraper):
             "pcs_points",
             "uci_points"
         )
-        fields = parse_table_fields_args(args, available_fields)
-        youth_table_html = self._table_html("youth")
-        if not youth_table_html:
-            return []
-        table_parser = TableParser(youth_table_html)
-        table_parser.parse(fields)
-        return table_parser.table
+        return self._parse_classification_table("youth", args,
+                                                available_fields)
 
     def teams(self, *args: str) -> List[Dict[str, Any]]:
         """
@@ -667,11 +665,29 @@ class Stage(Scraper):
             "time",
             "nationality"
         )
+        return self._parse_classification_table("teams", args,
+                                                available_fields)
+
+    def _parse_classification_table(self,
+            table: Literal["gc", "points", "kom", "youth", "teams"],
+            args: Tuple[str, ...],
+            available_fields: Tuple[str, ...]) -> List[Dict[str, Any]]:
+        """
+        Does general classification table parsing procedure using
+        TableParser.
+
+        :param table: Keyword of wanted table that occurs in result tabs.
+        :param args: Parsing method args (only the ones that
+            `TableParser.parse` method is able to parse).
+        :param available_fields: Available table fields for parsing method.
+        :return: Table with wanted fields. Empty list when the table is
+            unavailable.
+        """
         fields = parse_table_fields_args(args, available_fields)
-        teams_table_html = self._table_html("teams")
-        if not teams_table_html:
+        table_html = self._table_html(table)
+        if not table_html:
             return []
-        table_parser = TableParser(teams_table_html)
+        table_parser = TableParser(table_html)
         table_parser.parse(fields)
         return table_parser.table
 
@@ -683,10 +699,7 @@ class Stage(Scraper):
         :return: Value of given label. Empty string when label is not in
             infolist.
         """
-        stage_info = self._find_header_list("Race information")
-        for row in stage_info.css("li"):
-            row_text = row.text(separator="\n").split("\n")
-            row_text = [x for x in row_text if x != " "]
+        for row_text in self._stage_info_rows():
             if label in row_text[0]:
                 if len(row_text) > 1:
                     return row_text[1]
@@ -694,6 +707,22 @@ class Stage(Scraper):
                     return ""
         return ""
 
+    def _stage_info_rows(self) -> List[List[str]]:
+        """
+        Splits race information rows to their text lines.
+
+        :return: List of infolist rows, where every row is list of its text
+            lines without blank lines.
+        """
+        def split_rows() -> List[List[str]]:
+            stage_info = self._find_header_list("Race information")
+            rows = []
+            for row in stage_info.css("li"):
+                row_text = row.text(separator="\n").split("\n")
+                rows.append([x for x in row_text if x != " "])
+            return rows
+        return self._cached("_stage_info_rows", split_rows)
+
     def _table_html(self, table: Literal[
             "stage",
             "gc",
@@ -707,54 +736,67 @@ class Stage(Scraper):
         :param table: Keyword of wanted table that occurs in result tabs.
         :return: HTML of wanted HTML table, None when not found.
         """
-        # Map table names to their corresponding tab identifiers
-        tab_mapping = {
-            "stage": ["STAGE", "stage"],
-            "gc": ["GC", "gc"], 
-            "points": ["POINTS", "points"],
-            "kom": ["KOM", "kom"],
-            "youth": ["YOUTH", "youth"],
-            "teams": ["TEAMS", "teams"]
-        }
-        
-        # Look for tabs in the results section
-        tab_nav = self.html.css("ul.tabs.tabnav.resultTabs li")
-        if not tab_nav:
-            # Fallback to old tab structure
-            tab_nav = self.html.css("ul.restabs li")
-        
-        for tab_element in tab_nav:
-            tab_link = tab_element.css_first("a")
-            if not tab_link:
-                continue
-                
-            tab_text = tab_link.text().upper()
-            tab_keywords = tab_mapping.get(table, [])
-            
-            # Check if this tab matches what we're looking for
-            if any(keyword.upper() in tab_text for keyword in tab_keywords):
-                # Get the data-id from the tab link
-                data_id = tab_link.attributes.get("data-id")
-                if data_id:
-                    # Find corresponding result div
-                    result_div = self.html.css_first(f'div.resTab[data-id="{data_id}"]')
-                    if result_div:
-                        return result_div.css_first("table.results")
-        
-        # Fallback: look for result containers directly (old structure)
-        result_containers = self.html.css(".result-cont")
-        if result_containers and table == "stage":
-            # First container is usually stage results
-            return result_containers[0].css_first("table")
-        
-        # Additional fallback for direct table lookup
+        result_tables = self._result_tabs_tables()
+        if table in result_tables:
+            return result_tables[table]
+
         if table == "stage":
+            # Fallback: look for result containers directly (old structure)
+            result_containers = self.html.css(".result-cont")
+            if result_containers:
+                # First container is usually stage results
+                return result_containers[0].css_first("table")
+
+            # Additional fallback for direct table lookup
             stage_table = self.html.css_first("div.resTab table.results")
             if stage_table:
                 return stage_table
-            
         return None
 
+    def _result_tabs_tables(self) -> Dict[str, Optional[Node]]:
+        """
+        Finds HTML tables of all result tabs in a single pass through the tabs
+        menu.
+
+        :return: Dict mapping table keywords (see `_table_html`) to HTMLs of
+            the tables. Tables without a tab aren't contained in the dict.
+        """
+        def find_tables() -> Dict[str, Optional[Node]]:
+            # Look for tabs in the results section
+            tab_nav = self.html.css("ul.tabs.tabnav.resultTabs li")
+            if not tab_nav:
+                # Fallback to old tab structure
+                tab_nav = self.html.css("ul.restabs li")
+
+            result_tables = {}
+            for tab_element in tab_nav:
+                tab_link = tab_element.css_first("a")
+                if not tab_link:
+                    continue
+
+                tab_text = tab_link.text().upper()
+                # Tables that this tab matches and that weren't found yet
+                tables = [table for table, tab_keyword in
+                          self._result_tabs_keywords
+                          if table not in result_tables and
+                          tab_keyword in tab_text]
+                if not tables:
+                    continue
+                # Get the data-id from the tab link
+                data_id = tab_link.attributes.get("data-id")
+                if not data_id:
+                    continue
+                # Find corresponding result div
+                result_div = self.html.css_first(
+                    f'div.resTab[data-id="{data_id}"]')
+                if not result_div:
+                    continue
+                table_html = result_div.css_first("table.results")
+                for table in tables:
+                    result_tables[table] = table_html
+            return result_tables
+        return self._cached("_result_tabs_tables", find_tables)
+
     @staticmethod
     def _ttt_results(results_table_html: Node,
                      fields: List[str]) -> List[Dict[str, Any]]:
@@ -773,30 +815,29 @@ class Stage(Scraper):
             team_name = row.css_first("a").text()
             time = format_time(row.css_first("div.time").text())
             team_url = row.css_first("a").attributes['href']
+            # values shared by all riders of the team are filtered only once
+            team_values = {
+                "team_name": team_name,
+                "team_url": team_url,
+                "time": time,
+                "bonus": "0:00:00",
+                "status": "DF",
+                "rank": rank
+            }
+            team_values = {field: value for field, value in team_values.items()
+                           if field in fields}
             for tr_el in row.css("tbody > tr"):
-                table.append({})
-                rider_url = tr_el.css_first("a").attributes['href']
-                table[-1]["rider_url"] = rider_url
+                rider_a = tr_el.css_first("a")
+                rider_row = {"rider_url": rider_a.attributes['href']}
                 if "rider_name" in fields:
-                    rider_name = tr_el.css_first("a").text()
-                    table[-1]["rider_name"] = rider_name
+                    rider_row["rider_name"] = rider_a.text()
                 if "pcs_points" in fields:
                     pcs_points = tr_el.css_first("td.w7").text()
                     if not pcs_points:
                         pcs_points = 0
-                    table[-1]["pcs_points"] = float(pcs_points)
+                    rider_row["pcs_points"] = float(pcs_points)
                 if "uci_points" in fields:
-                    table[-1]["uci_points"] = float(0)
-                if "team_name" in fields:
-                    table[-1]["team_name"] = team_name
-                if "team_url" in fields:
-                    table[-1]["team_url"] = team_url
-                if "time" in fields:
-                    table[-1]["time"] = time
-                if "bonus" in fields:
-                    table[-1]["bonus"] = "0:00:00"
-                if "status" in fields:
-                    table[-1]["status"] = "DF"
-                if "rank" in fields:
-                    table[-1]["rank"] = rank
+                    rider_row["uci_points"] = float(0)
+                rider_row.update(team_values)
+                table.append(rider_row)
         return table
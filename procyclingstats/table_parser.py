@@ -1,3 +1,4 @@
+import re
 from typing import Any, Callable, Dict, List, Literal, Optional, Tuple, Union, Set
 
 from selectolax.parser import Node
@@ -25,6 +26,8 @@ class TableParser:
         "li": "div"
     }
     """Finds out what is the table row column tag."""
+    _leading_number_regex = re.compile(r"\d+(?:\.\d*)?")
+    """Matches number at the beginning of a string."""
 
     def __init__(self, html_table: Node) -> None:
         self.table = []
@@ -35,11 +38,20 @@ class TableParser:
         else:
             self.html_table = html_table
             self.header = None
+        # lowercased header texts, parsed on first lookup by header value
+        self._header_texts: Optional[List[str]] = None
+        # raw column texts by (index, separator, get_href), so the same column
+        # parsed with different functions is traversed only once
+        self._raw_columns: Dict[Tuple[int, str, bool], List[str]] = {}
 
         self.table_row_tag = self.table_row_dict[self.html_table.tag]
         self.row_column_tag = self.row_column_tag_dict[self.table_row_tag]
 
         self.a_elements = self.html_table.css("a")
+        # hrefs of `self.a_elements` and their parts, parsed on first
+        # filtering of a elements
+        self._a_hrefs: Optional[List[Optional[str]]] = None
+        self._a_hrefs_parts: Optional[List[Set[str]]] = None
         self.table_length = len(self.html_table.css(self.table_row_tag))
         self.row_length = len(self.html_table.css(
             f"{self.table_row_tag}:first-child > {self.row_column_tag}"))
@@ -102,8 +114,9 @@ class TableParser:
                 parsed_field_list = getattr(self, "class_")()
 
             # Ensure parsed field list matches the number of rows
-            while len(parsed_field_list) < len(raw_table):
-                parsed_field_list.append(None)
+            missing_count = len(raw_table) - len(parsed_field_list)
+            if missing_count > 0:
+                parsed_field_list.extend([None] * missing_count)
 
             if len(parsed_field_list) != len(raw_table):
                 message = f"Field '{field}' wasn't parsed correctly"
@@ -157,21 +170,23 @@ class TableParser:
             index = index_or_header_value
         if index < 0:
             index = self.row_length + index
-        elements = self.html_table.css(
-            f"{self.table_row_tag} > {self.row_column_tag}:nth-child({index+1})"
-        )
-
-        values = []
-        for element in elements:
-            text = element.text(separator=separator)
-            if get_href:
-                a_element = element.css_first("a")
-                if a_element:
-                    text = a_element.attributes['href']
-                else:
-                    text = ""
-            values.append(func(text))
-        return values
+        raw_column_key = (index, separator, get_href)
+        if raw_column_key not in self._raw_columns:
+            elements = self.html_table.css(
+                f"{self.table_row_tag} > {self.row_column_tag}:nth-child({index+1})"
+            )
+            texts = []
+            for element in elements:
+                text = element.text(separator=separator)
+                if get_href:
+                    a_element = element.css_first("a")
+                    if a_element:
+                        text = a_element.attributes['href']
+                    else:
+                        text = ""
+                texts.append(text)
+            self._raw_columns[raw_column_key] = texts
+        return [func(text) for text in self._raw_columns[raw_column_key]]
 
     def rider_url(self) -> List[str]:
         return self._filter_a_elements("rider", True)
@@ -240,29 +255,27 @@ class TableParser:
             res = 0
             try:
                 title = element.css_first("div[title~=peloton").attrs['title']
-                for i in range(1, len(title) + 1):
-                    try:
-                        float(title[:i])
-                        res = float(title[:i])
-                    except ValueError:
-                        break
+                # longest number at the beginning of the title
+                match = self._leading_number_regex.match(title)
+                if match:
+                    res = float(match.group())
             except AttributeError:
               pass
             kms.append(res)
         return kms
 
     def age(self) -> List[Optional[int]]:
-        ages_elements = self.html_table.css(".age")
-        return [int(age_e.text()) if age_e.text() else None
-            for age_e in ages_elements]
+        ages_texts = [age_e.text() for age_e in self.html_table.css(".age")]
+        return [int(age_text) if age_text else None
+            for age_text in ages_texts]
 
     def nationality(self) -> List[str]:
         flags_elements = self.html_table.css(".flag")
         flags = []
         for flag_e in flags_elements:
-            if (flag_e.attributes['class'] and
-                    " " in flag_e.attributes['class']):
-                flags.append(flag_e.attributes['class'].split(" ")[1].upper())
+            flag_class = flag_e.attributes['class']
+            if flag_class and " " in flag_class:
+                flags.append(flag_class.split(" ")[1].upper())
         return flags
 
     def time(self) -> List[Optional[str]]:
@@ -323,8 +336,9 @@ class TableParser:
         profiles = []
         for icon_e in icons_elements:
             classes = icon_e.attributes['class']
-            if classes and len(classes.split(" ")) >= 3:
-                profiles.append(classes.split(" ")[2])
+            splitted_classes = classes.split(" ") if classes else []
+            if len(splitted_classes) >= 3:
+                profiles.append(splitted_classes[2])
         return profiles
 
     def season(self) -> List[Optional[int]]:
@@ -347,12 +361,12 @@ class TableParser:
         return seasons
     
     def rider_number(self) -> List[Optional[int]]:
-        bibs_elements = self.html_table.css(".bibs")
-        return [int(bib_e.text()) if bib_e.text().isnumeric() else None \
-            for bib_e in bibs_elements]
+        bibs_texts = [bib_e.text() for bib_e in self.html_table.css(".bibs")]
+        return [int(bib_text) if bib_text.isnumeric() else None \
+            for bib_text in bibs_texts]
 
     def rank(self) -> List[Optional[int]]:
-        possible_columns = ["Rnk", "pos", "Result", "#"]
+        possible_columns = ("Rnk", "pos", "Result", "#")
         for column_name in possible_columns:
             try:
                 return self.parse_extra_column(column_name,
@@ -393,7 +407,7 @@ class TableParser:
 
     def points(self) -> List[int]:
         # Try different possible column names for points
-        possible_columns = ["Points", "Pnt", "PCS points"]
+        possible_columns = ("Points", "Pnt", "PCS points")
         for column_name in possible_columns:
             try:
                 return self.parse_extra_column(column_name, lambda x:
@@ -447,9 +461,11 @@ class TableParser:
         if self.header is None:
             raise ExpectedParsingError(
                 f"Can not parse '{column_name}' column without table header")
-        for i, column_name_e in enumerate(self.header.css("th")):
-            header_text = column_name_e.text().lower().strip()
-            search_text = column_name.lower().strip()
+        if self._header_texts is None:
+            self._header_texts = [th.text().lower().strip()
+                                  for th in self.header.css("th")]
+        search_text = column_name.lower().strip()
+        for i, header_text in enumerate(self._header_texts):
             if search_text in header_text:
                 return i
         raise ValueError(
@@ -476,13 +492,14 @@ class TableParser:
         first_time = self.table[0][time_field]
         for i, row in enumerate(self.table[1:]):
             if row[time_field]:
-                    row[time_field] = add_times(first_time, row[time_field])
+                row[time_field] = add_times(first_time, row[time_field])
             else:
                 if i == 0:
                     row[time_field] = "0:00:00"
                 else:
-                    # set same time as prev rider
-                    row[time_field] = self.table[1:][i - 1][time_field]
+                    # set same time as prev rider (`i` is shifted by one, so
+                    # previous row is at index `i` of the whole table)
+                    row[time_field] = self.table[i][time_field]
 
 
     def _filter_a_elements(self, keyword: str, get_href: bool,
@@ -505,11 +522,15 @@ class TableParser:
         else:
             extras.add(keyword)
         filtered_values = []
-        for a_element in self.a_elements:
-            href = a_element.attributes.get('href', None)
+        if self._a_hrefs is None or self._a_hrefs_parts is None:
+            self._a_hrefs = [a_element.attributes.get('href', None)
+                             for a_element in self.a_elements]
+            self._a_hrefs_parts = [set(href.split("/")) if href else set()
+                                   for href in self._a_hrefs]
+        for a_element, href, parts in zip(self.a_elements, self._a_hrefs,
+                                          self._a_hrefs_parts):
             if not href:
                 continue  # Skip elements without href
-            parts = set(href.split("/"))
             for kwrd in extras:
                 if kwrd in parts:
                     if get_href:
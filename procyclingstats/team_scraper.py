@@ -1,4 +1,4 @@
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from .errors import ExpectedParsingError
 from .scraper import Scraper
@@ -124,17 +124,23 @@ class Team(Scraper):
         :param stat_name: Label text to search for (e.g. "Victories", "Points").
         :return: Integer value of the stat or None if not found.
         """
-        for li in self.html.css("ul.teamkpi > li"):
-            font_el = li.css_first("div.title")
-            if font_el and font_el.text().strip() == stat_name:
+        # stats of all labels are parsed at once and cached, first parsed
+        # value of every label is used
+        def parse_stats() -> Dict[str, int]:
+            stats: Dict[str, int] = {}
+            for li in self.html.css("ul.teamkpi > li"):
+                font_el = li.css_first("div.title")
                 a_el = li.css_first("div.value > a")
-                if a_el:
-                    value = a_el.text(strip=True)
-                    if value.isdigit():
-                        return int(value)
-                    elif value == "-":
-                        return 0
-        return None
+                if not font_el or not a_el:
+                    continue
+                label = font_el.text().strip()
+                value = a_el.text(strip=True)
+                if value.isdigit():
+                    stats.setdefault(label, int(value))
+                elif value == "-":
+                    stats.setdefault(label, 0)
+            return stats
+        return self._cached("_parse_team_stat", parse_stats).get(stat_name)
 
     def wins_count(self) -> Optional[int]:
         """
@@ -185,8 +191,11 @@ class Team(Scraper):
             if not options:
                 continue
                 
-            # Check if this looks like a team history select by examining the values
-            values = [opt.attributes.get("value", "") for opt in options if opt.attributes.get("value")]
+            # Check if this looks like a team history select by examining the
+            # values, they are generated lazily so the check stops on first
+            # matching option (valueless placeholder options are skipped)
+            values = (v for v in (opt.attributes.get("value")
+                                  for opt in options) if v)
             
             # Match values that look like team/<team-name>/<year>/overview/
             if any("team/" in v and "/overview" in v for v in values):
@@ -294,16 +303,29 @@ class Team(Scraper):
         :return: Value of given label. Empty string when label is not in
             infolist.
         """
-        # Look for the infolist in the team page
-        infolist = self.html.css_first("ul.infolist")
-        if not infolist:
-            return ""
-        
-        for li in infolist.css("li"):
-            # Each li contains two divs - label and value
-            divs = li.css("div")
-            if len(divs) >= 2:
-                label_text = divs[0].text(strip=True)
-                if label.lower() in label_text.lower():
-                    return divs[1].text(strip=True)
-        return ""
\ No newline at end of file
+        label = label.lower()
+        for label_text, value in self._team_info_rows():
+            if label in label_text:
+                return value
+        return ""
+
+    def _team_info_rows(self) -> List[Tuple[str, str]]:
+        """
+        Parses team infolist to label and value pairs.
+
+        :return: List of tuples with lowercased label and value of every
+            infolist row.
+        """
+        def parse_rows() -> List[Tuple[str, str]]:
+            rows = []
+            # Look for the infolist in the team page
+            infolist = self.html.css_first("ul.infolist")
+            if infolist:
+                for li in infolist.css("li"):
+                    # Each li contains two divs - label and value
+                    divs = li.css("div")
+                    if len(divs) >= 2:
+                        rows.append((divs[0].text(strip=True).lower(),
+                                     divs[1].text(strip=True)))
+            return rows
+        return self._cached("_team_info_rows", parse_rows)
\ No newline at end of file
@@ -1,10 +1,18 @@
+import calendar
 import datetime
+from functools import lru_cache
 from typing import Any, Dict, List, Tuple, Union, Optional
 
 from selectolax.parser import HTMLParser, Node
 
 from .errors import ExpectedParsingError
 
+MONTHS_NUMBERS: Dict[str, int] = {
+    month_name.lower(): i
+    for i, month_name in enumerate(calendar.month_name) if month_name
+}
+"""Maps lowercase month names to month numbers, e.g. ``july`` to 7."""
+
 
 # date and time manipulation functions
 def get_day_month(str_with_date: str) -> str:
@@ -39,12 +47,14 @@ def convert_date(date: str) -> str:
 
     :param date: Date to convert, day, month and year have to be separated by
     spaces and month has to be in word form e.g. `30 July 2022`.
+    :raises ValueError: When month isn't a valid month name.
     :return: Date in `YYYY-MM-DD` format.
     """
     [day, month, year] = date.split(" ")
-    month = datetime.datetime.strptime(month, "%B").month
-    month = f"0{month}" if month < 10 else str(month)
-    return "-".join([year, month, day])
+    month_number = MONTHS_NUMBERS.get(month.lower())
+    if month_number is None:
+        raise ValueError(f"Invalid month name: '{month}'")
+    return f"{year}-{month_number:02d}-{day}"
 
 def timedelta_to_time(tdelta: datetime.timedelta) -> str:
     """
@@ -53,17 +63,15 @@ def timedelta_to_time(tdelta: datetime.timedelta) -> str:
     :param tdelta: Timedelta to convert.
     :return: Formatted time.
     """
-    time = str(tdelta).split(" ")
-    if len(time) > 1:
-        days = time[0]
-        time = time[2]
-        hours = int(time.split(":")[0]) + (24 * int(days))
-        minutes_seconds = ":".join(time.split(":")[1:])
-    else:
-        hours = time[0].split(":")[0]
-        minutes_seconds = ":".join(time[0].split(":")[1:])
-    return f"{hours}:{minutes_seconds}"
+    # timedelta keeps seconds in range of one day, days are added to hours
+    hours, rest = divmod(tdelta.seconds, 3600)
+    minutes, seconds = divmod(rest, 60)
+    time = f"{hours + 24 * tdelta.days}:{minutes:02d}:{seconds:02d}"
+    if tdelta.microseconds:
+        time += f".{tdelta.microseconds:06d}"
+    return time
 
+@lru_cache(maxsize=1024)
 def time_to_timedelta(time: str) -> datetime.timedelta:
     """
     Converts time in `H:MM:SS` or `H:MM:SS.ms` format to timedelta.
@@ -86,6 +94,7 @@ def time_to_timedelta(time: str) -> datetime.timedelta:
     except Exception as e:
         raise ValueError(f"Invalid time format: {time}") from e
 
+@lru_cache(maxsize=1024)
 def format_time(time: str) -> str:
     """
     Convert time from formats like `M:SS`, `MM:SS`, or `MM.SS,ms` to `H:MM:SS` or `H:MM:SS.ms`.
@@ -140,13 +149,8 @@ def parse_select(select_menu: Node) -> List[Dict[str, str]]:
     :return: Parsed select menu represented as list of dicts with keys `text`
     and `value`.
     """
-    table = []
-    for option in select_menu.css("option"):
-        table.append({
-            "text": option.text(),
-            "value": option.attributes['value']
-        })
-    return table
+    return [{"text": option.text(), "value": option.attributes['value']}
+            for option in select_menu.css("option")]
 
 def select_menu_by_name(html: Union[Node, HTMLParser], name_attr: str) -> Node:
     """
@@ -186,8 +190,13 @@ def join_tables(table1: List[Dict[str, Any]],
     table2_dict = {row[join_key]: row for row in table2}
     table = []
     for row in table1:
-        if not skip_missing or table2_dict.get(row[join_key]):
-            table.append({**table2_dict[row[join_key]], **row})
+        if skip_missing:
+            row2 = table2_dict.get(row[join_key])
+            if not row2:
+                continue
+        else:
+            row2 = table2_dict[row[join_key]]
+        table.append({**row2, **row})
     return table
 
 def parse_table_fields_args(args: Tuple[str],
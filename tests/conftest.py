@@ -0,0 +1,14 @@
+import pytest
+
+from .fixtures_utils import FixturesUtils
+
+
+@pytest.fixture(scope="session")
+def f_utils() -> FixturesUtils:
+    """
+    Fixtures utils shared by all tests, so fixtures directory is scanned only
+    once per test session.
+
+    :return: FixturesUtils object working with `tests/fixtures/` directory.
+    """
+    return FixturesUtils(fixtures_path="tests/fixtures/")
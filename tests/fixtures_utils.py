@@ -7,6 +7,11 @@ from procyclingstats import Scraper
 from procyclingstats.__main__ import get_corresponding_scraping_class
 from procyclingstats.errors import ExpectedParsingError
 
+# Forbidden on Windows: < > : " / \ | ? * and also replace & =
+FILENAME_TRANSLATION = str.maketrans(dict.fromkeys('<>:"/\\|?*&=', "_"))
+"""Translation table replacing characters forbidden in filenames with
+underscores."""
+
 
 class FixturesUtils:
     """
@@ -29,6 +34,10 @@ class FixturesUtils:
 
     def __init__(self, fixtures_path: str = "tests/fixtures/") -> None:
         self.fixtures_path = fixtures_path
+        # URLs of fixtures with both HTML and JSON file by their scraper class,
+        # made on first use
+        self._urls_by_scraper_class: Optional[
+            Dict[Type[Scraper], List[str]]] = None
 
     def make_data_fixture(self, scraper_obj: Scraper) -> None:
         """
@@ -44,6 +53,8 @@ class FixturesUtils:
         path = os.path.join(self.fixtures_path, f"{filename}.json")
         with open(path, "w", encoding="utf-8") as fixture:
             fixture.write(json_obj)
+        # fixtures directory changed
+        self._urls_by_scraper_class = None
 
     def make_html_fixture(self, scraper_obj: Scraper) -> None:
         """
@@ -56,6 +67,8 @@ class FixturesUtils:
         path = os.path.join(self.fixtures_path, f"{filename}.txt")
         with open(path, "w", encoding="utf-8") as fixture:
             fixture.write(scraper_obj.html.html) # type: ignore
+        # fixtures directory changed
+        self._urls_by_scraper_class = None
 
     def get_data_fixture(self, url: str) -> Optional[Dict[str, Any]]:
         """
@@ -93,25 +106,40 @@ class FixturesUtils:
             self, scraper_class: Type[Scraper]) -> List[Scraper]:
         """
         Creates scraper object of ScraperClass from every HTML fixture which
-        URL is valid for given ScraperClass.
+        URL is valid for given ScraperClass and which has a data fixture.
+        Fixture URLs are grouped by `_get_urls_by_scraper_class`.
 
         :param ScraperClass: Class to create objects from.
         :return: List with scraper objects ready for HTML parsing.
         """
-        html_files_urls = self.get_urls_from_fixtures_dir("txt")
-        json_files_urls = self.get_urls_from_fixtures_dir("json")
-        # get URLs of all scraper objects that have both HTML and JSON file
-        urls = [url for url in html_files_urls if url in json_files_urls]
         objects_to_test = []
-        for url in urls:
-            # add scraper object if current fixture is it's fixture
-            if get_corresponding_scraping_class(url) == scraper_class:
-                # get HTML of scraper object from fixtures
-                html = self.get_html_fixture(url)
-                # add new scraper object that is ready for parsing to the list
-                objects_to_test.append(scraper_class(url, html, False))
+        for url in self._get_urls_by_scraper_class().get(scraper_class, []):
+            # get HTML of scraper object from fixtures
+            html = self.get_html_fixture(url)
+            # add new scraper object that is ready for parsing to the list
+            objects_to_test.append(scraper_class(url, html, False))
         return objects_to_test
 
+    def _get_urls_by_scraper_class(self) -> Dict[Type[Scraper], List[str]]:
+        """
+        Groups URLs of fixtures that have both HTML and JSON file by their
+        scraper class. Fixtures directory is scanned again only after a
+        fixture was made by this object.
+
+        :return: Dict mapping scraper classes to URLs of their fixtures.
+        """
+        if self._urls_by_scraper_class is None:
+            html_files_urls = self.get_urls_from_fixtures_dir("txt")
+            json_files_urls = set(self.get_urls_from_fixtures_dir("json"))
+            self._urls_by_scraper_class = {}
+            # get URLs of all scraper objects that have both HTML and JSON file
+            for url in html_files_urls:
+                if url in json_files_urls:
+                    scraper_class = get_corresponding_scraping_class(url)
+                    self._urls_by_scraper_class.setdefault(
+                        scraper_class, []).append(url)
+        return self._urls_by_scraper_class
+
     def get_urls_from_fixtures_dir(self, file_type: str) -> List[str]:
         """
         Converts filesnames with wanted type to relative URLs.
@@ -134,12 +162,7 @@ class FixturesUtils:
         :param url: Relative URL to convert filename from.
         :return: Filename without file type.
         """
-        # Forbidden on Windows: < > : " / \ | ? * and also replace & =
-        forbidden = '<>:"/\\|?*&='
-        filename = url
-        for ch in forbidden:
-            filename = filename.replace(ch, '_')
-        return filename
+        return url.translate(FILENAME_TRANSLATION)
 
     @staticmethod
     def filename_to_url(filename: str) -> str:
@@ -31,15 +31,16 @@ class ScraperTestBaseClass:
     """
     ScraperClass = Scraper
 
-    def test_parser(self, subtests) -> None:
+    def test_parser(self, subtests, f_utils: FixturesUtils) -> None:
         """
         Tests parser method of current `ScraperClass` against all data fixtures
         that are created by instances of current `ScraperClass`. HTML is always
         loaded from corresponding HTML fixture.
 
         :param subtests: Subtests module, passed by pytest.
+        :param f_utils: Fixtures utils shared by the test session, passed by
+            pytest.
         """
-        f_utils = FixturesUtils(fixtures_path="tests/fixtures/")
         objects_to_test = f_utils.get_scraper_objects_from_fixtures(
             self.ScraperClass)
         parsed_data = []
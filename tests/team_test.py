@@ -0,0 +1,13 @@
+from procyclingstats import Team
+
+
+def test_history_select_skips_placeholder_option() -> None:
+    html = ('<div class="selectNav"><select>'
+            '<option value>Choose</option>'
+            '<option value="team/a-2020/overview/">2020</option>'
+            '</select></div>')
+    team = Team("team/a-2020", html, False)
+    assert team.history_select() == [
+        {"text": "Choose", "value": None},
+        {"text": "2020", "value": "team/a-2020/overview/"},
+    ]
@@ -0,0 +1,15 @@
+import datetime
+
+import pytest
+
+from procyclingstats.utils import timedelta_to_time
+
+
+# expected times are outputs of the former `str(tdelta)` based formatting
+@pytest.mark.parametrize("tdelta,time", [
+    (datetime.timedelta(days=1, seconds=5), "24:00:05"),
+    (datetime.timedelta(seconds=-10), "-1:59:50"),
+    (datetime.timedelta(seconds=1, microseconds=500000), "0:00:01.500000"),
+])
+def test_timedelta_to_time(tdelta: datetime.timedelta, time: str) -> None:
+    assert timedelta_to_time(tdelta) == time